@@ -36,6 +36,8 @@ Example usage:
 import collections
 import warnings
 
+from six.moves import intern
+
 try:
     from collections import abc as collections_abc
 except ImportError:  # Python 2.7
@@ -43,18 +45,42 @@ except ImportError:  # Python 2.7
 
 # Generic IAM roles
 
-OWNER_ROLE = "roles/owner"
+OWNER_ROLE = intern("roles/owner")
 """Generic role implying all rights to an object."""
 
-EDITOR_ROLE = "roles/editor"
+EDITOR_ROLE = intern("roles/editor")
 """Generic role implying rights to modify an object."""
 
-VIEWER_ROLE = "roles/viewer"
+VIEWER_ROLE = intern("roles/viewer")
 """Generic role implying rights to access an object."""
 
+
+def _intern_role(role):
+    """Intern ``str`` role keys so lookups via the role constants match by
+    identity.  Python 2 cannot intern ``unicode``, so it is left as-is."""
+    if type(role) is str:
+        return intern(role)
+    return role
+
+
+class _Bindings(collections.defaultdict):
+    """Role -> members mapping which interns roles inserted on a miss."""
+
+    __slots__ = ()
+
+    def __missing__(self, key):
+        key = _intern_role(key)
+        value = self[key] = set()
+        return value
+
+
 _ASSIGNMENT_DEPRECATED_MSG = """\
 Assigning to '{}' is deprecated.  Replace with 'policy[{}] = members."""
 
+_OWNERS_DEPRECATED_MSG = _ASSIGNMENT_DEPRECATED_MSG.format("owners", OWNER_ROLE)
+_EDITORS_DEPRECATED_MSG = _ASSIGNMENT_DEPRECATED_MSG.format("editors", EDITOR_ROLE)
+_VIEWERS_DEPRECATED_MSG = _ASSIGNMENT_DEPRECATED_MSG.format("viewers", VIEWER_ROLE)
+
 
 class Policy(collections_abc.MutableMapping):
     """IAM Policy
@@ -67,6 +93,13 @@ class Policy(collections_abc.MutableMapping):
         version (Optional[int]): unique version of the policy
     """
 
+    __slots__ = ("etag", "version", "_bindings")
+    if not hasattr(collections_abc.MutableMapping, "__weakref__"):
+        # Keep weak references and ad-hoc attributes working.  The slotted
+        # ``__dict__`` is only allocated once an undeclared attribute is set.
+        # Python 2.7 ABCs are unslotted and already provide both.
+        __slots__ += ("__dict__", "__weakref__")
+
     _OWNER_ROLES = (OWNER_ROLE,)
     """Roles mapped onto our ``owners`` attribute."""
 
@@ -79,7 +112,7 @@ class Policy(collections_abc.MutableMapping):
     def __init__(self, etag=None, version=None):
         self.etag = etag
         self.version = version
-        self._bindings = collections.defaultdict(set)
+        self._bindings = _Bindings(set)
 
     def __iter__(self):
         return iter(self._bindings)
@@ -91,7 +124,7 @@ class Policy(collections_abc.MutableMapping):
         return self._bindings[key]
 
     def __setitem__(self, key, value):
-        self._bindings[key] = set(value)
+        self._bindings[_intern_role(key)] = set(value)
 
     def __delitem__(self, key):
         del self._bindings[key]
@@ -103,8 +136,7 @@ class Policy(collections_abc.MutableMapping):
         DEPRECATED:  use ``policy["roles/owners"]`` instead."""
         result = set()
         for role in self._OWNER_ROLES:
-            for member in self._bindings.get(role, ()):
-                result.add(member)
+            result.update(self._bindings.get(role, ()))
         return frozenset(result)
 
     @owners.setter
@@ -112,9 +144,7 @@ class Policy(collections_abc.MutableMapping):
         """Update owners.
 
         DEPRECATED:  use ``policy["roles/owners"] = value`` instead."""
-        warnings.warn(
-            _ASSIGNMENT_DEPRECATED_MSG.format("owners", OWNER_ROLE), DeprecationWarning
-        )
+        warnings.warn(_OWNERS_DEPRECATED_MSG, DeprecationWarning)
         self[OWNER_ROLE] = value
 
     @property
@@ -124,8 +154,7 @@ class Policy(collections_abc.MutableMapping):
         DEPRECATED:  use ``policy["roles/editors"]`` instead."""
         result = set()
         for role in self._EDITOR_ROLES:
-            for member in self._bindings.get(role, ()):
-                result.add(member)
+            result.update(self._bindings.get(role, ()))
         return frozenset(result)
 
     @editors.setter
@@ -133,10 +162,7 @@ class Policy(collections_abc.MutableMapping):
         """Update editors.
 
         DEPRECATED:  use ``policy["roles/editors"] = value`` instead."""
-        warnings.warn(
-            _ASSIGNMENT_DEPRECATED_MSG.format("editors", EDITOR_ROLE),
-            DeprecationWarning,
-        )
+        warnings.warn(_EDITORS_DEPRECATED_MSG, DeprecationWarning)
         self[EDITOR_ROLE] = value
 
     @property
@@ -147,8 +173,7 @@ class Policy(collections_abc.MutableMapping):
         """
         result = set()
         for role in self._VIEWER_ROLES:
-            for member in self._bindings.get(role, ()):
-                result.add(member)
+            result.update(self._bindings.get(role, ()))
         return frozenset(result)
 
     @viewers.setter
@@ -157,10 +182,7 @@ class Policy(collections_abc.MutableMapping):
 
         DEPRECATED:  use ``policy["roles/viewers"] = value`` instead.
         """
-        warnings.warn(
-            _ASSIGNMENT_DEPRECATED_MSG.format("viewers", VIEWER_ROLE),
-            DeprecationWarning,
-        )
+        warnings.warn(_VIEWERS_DEPRECATED_MSG, DeprecationWarning)
         self[VIEWER_ROLE] = value
 
     @staticmethod
@@ -173,7 +195,10 @@ class Policy(collections_abc.MutableMapping):
         Returns:
             str: A member string corresponding to the given user.
         """
-        return "user:%s" % (email,)
+        try:
+            return "user:" + email
+        except TypeError:  # non-text input
+            return "user:%s" % (email,)
 
     @staticmethod
     def service_account(email):
@@ -185,7 +210,10 @@ class Policy(collections_abc.MutableMapping):
         Returns:
             str: A member string corresponding to the given service account.
         """
-        return "serviceAccount:%s" % (email,)
+        try:
+            return "serviceAccount:" + email
+        except TypeError:  # non-text input
+            return "serviceAccount:%s" % (email,)
 
     @staticmethod
     def group(email):
@@ -197,7 +225,10 @@ class Policy(collections_abc.MutableMapping):
         Returns:
             str: A member string corresponding to the given group.
         """
-        return "group:%s" % (email,)
+        try:
+            return "group:" + email
+        except TypeError:  # non-text input
+            return "group:%s" % (email,)
 
     @staticmethod
     def domain(domain):
@@ -209,7 +240,10 @@ class Policy(collections_abc.MutableMapping):
         Returns:
             str: A member string corresponding to the given domain.
         """
-        return "domain:%s" % (domain,)
+        try:
+            return "domain:" + domain
+        except TypeError:  # non-text input
+            return "domain:%s" % (domain,)
 
     @staticmethod
     def all_users():
@@ -243,9 +277,7 @@ class Policy(collections_abc.MutableMapping):
         etag = resource.get("etag")
         policy = cls(etag, version)
         for binding in resource.get("bindings", ()):
-            role = binding["role"]
-            members = sorted(binding["members"])
-            policy[role] = members
+            policy[binding["role"]] = binding["members"]
         return policy
 
     def to_api_repr(self):
@@ -254,21 +286,14 @@ class Policy(collections_abc.MutableMapping):
         Returns:
             dict: a resource to be passed to the ``setIamPolicy`` API.
         """
-        resource = {}
-
-        if self.etag is not None:
-            resource["etag"] = self.etag
-
-        if self.version is not None:
-            resource["version"] = self.version
-
-        if self._bindings:
-            bindings = resource["bindings"] = []
-            for role, members in sorted(self._bindings.items()):
-                if members:
-                    bindings.append({"role": role, "members": sorted(set(members))})
-
-            if not bindings:
-                del resource["bindings"]
-
-        return resource
+        bindings = [
+            {"role": role, "members": sorted(members)}
+            for role, members in sorted(self._bindings.items())
+            if members
+        ]
+        fields = (
+            ("etag", self.etag),
+            ("version", self.version),
+            ("bindings", bindings or None),
+        )
+        return {key: value for key, value in fields if value is not None}
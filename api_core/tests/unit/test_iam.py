@@ -49,10 +49,30 @@ class TestPolicy:
         assert len(policy) == 0
         assert dict(policy) == {}
 
+    def test_weakref(self):
+        import weakref
+
+        policy = self._make_one()
+        assert weakref.ref(policy)() is policy
+
+    def test_extra_attribute(self):
+        policy = self._make_one()
+        policy.extra = 1
+        assert policy.extra == 1
+
     def test___getitem___miss(self):
         policy = self._make_one()
         assert policy["nonesuch"] == set()
 
+    def test___len___after_inplace_add(self):
+        USER = "user:phred@example.com"
+        policy = self._make_one()
+        policy["rolename"].add(USER)
+        assert len(policy) == 1
+        assert policy.to_api_repr() == {
+            "bindings": [{"role": "rolename", "members": [USER]}]
+        }
+
     def test___setitem__(self):
         USER = "user:phred@example.com"
         PRINCIPALS = set([USER])
@@ -62,6 +82,46 @@ class TestPolicy:
         assert len(policy) == 1
         assert dict(policy) == {"rolename": PRINCIPALS}
 
+    def test___setitem___w_set_copies(self):
+        USER = "user:phred@example.com"
+        GROUP = "group:cloud-logs@google.com"
+        members = set([USER])
+        policy = self._make_one()
+        policy["rolename"] = members
+        members.add(GROUP)
+        assert policy["rolename"] == set([USER])
+        assert policy["rolename"] is not members
+
+    def test___getitem___equal_but_not_identical_key(self):
+        from google.api_core.iam import OWNER_ROLE
+
+        USER = "user:phred@example.com"
+        policy = self._make_one()
+        policy[OWNER_ROLE] = [USER]
+        key = "".join(["roles/", "owner"])
+        assert key is not OWNER_ROLE
+        assert policy[key] == set([USER])
+        assert policy.owners == frozenset([USER])
+
+    def test___setitem___interns_role(self):
+        from google.api_core.iam import OWNER_ROLE
+
+        USER = "user:phred@example.com"
+        policy = self._make_one()
+        policy["".join(["roles/", "owner"])] = [USER]
+        key, = list(policy)
+        assert key is OWNER_ROLE
+
+    def test___getitem___miss_interns_role(self):
+        from google.api_core.iam import OWNER_ROLE
+
+        USER = "user:phred@example.com"
+        policy = self._make_one()
+        policy["".join(["roles/", "owner"])].add(USER)
+        key, = list(policy)
+        assert key is OWNER_ROLE
+        assert policy.owners == frozenset([USER])
+
     def test___delitem___hit(self):
         policy = self._make_one()
         policy._bindings["rolename"] = ["phred@example.com"]
@@ -83,6 +143,17 @@ class TestPolicy:
         policy[OWNER_ROLE] = [MEMBER]
         assert policy.owners == expected
 
+    def test_owners_getter_after_inplace_update(self):
+        from google.api_core.iam import OWNER_ROLE
+
+        MEMBER1 = "user:phred@example.com"
+        MEMBER2 = "group:admins@example.com"
+        policy = self._make_one()
+        policy[OWNER_ROLE] = [MEMBER1]
+        assert policy.owners == frozenset([MEMBER1])
+        policy[OWNER_ROLE].add(MEMBER2)
+        assert policy.owners == frozenset([MEMBER1, MEMBER2])
+
     def test_owners_setter(self):
         import warnings
         from google.api_core.iam import OWNER_ROLE
@@ -170,6 +241,14 @@ class TestPolicy:
         policy = self._make_one()
         assert policy.domain(DOMAIN) == MEMBER
 
+    def test_member_factories_w_non_text(self):
+        ID = 1234
+        policy = self._make_one()
+        assert policy.user(ID) == "user:1234"
+        assert policy.service_account(ID) == "serviceAccount:1234"
+        assert policy.group(ID) == "group:1234"
+        assert policy.domain(ID) == "domain:1234"
+
     def test_all_users(self):
         policy = self._make_one()
         assert policy.all_users() == "allUsers"